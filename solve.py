@@ -0,0 +1,7 @@
+from tictactoe import POLICY_FILE, save_policy, solve
+
+
+if __name__ == "__main__":
+    values, policy = solve()
+    save_policy(POLICY_FILE, policy)
+    print(f"Game value from the empty board: {values[0]:+d}. Policy saved to {POLICY_FILE}.")
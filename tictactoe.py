@@ -1,65 +1,168 @@
 import tkinter as tk
 import json
+from array import array
+from functools import lru_cache
 import random
 import os
 import time
 
 # ---------------- Hyperparameters ----------------
 ALPHA = 0.3
-GAMMA = 0.9
 EPSILON = 0.2
 MIN_EPSILON = 0.05
 EPSILON_DECAY = 0.99995
-SAVE_INTERVAL = 500
-Q_FILE = "player_qtable.json"
+SAVE_INTERVAL = 512  # must be a power of two
+MIN_SLEEP = 0.002
+Q_FILE = "player_qtable.bin"
+LEGACY_Q_FILE = "player_qtable.json"
 STATS_FILE = "player_stats.json"
+POLICY_FILE = "optimal_policy.bin"
+
+# ---------------- Board Encoding ----------------
+# The board is packed into a base-3 integer (0..19682), one digit per cell.
+CELL_VALUE = {"_": 0, "X": 1, "O": 2}
+POW3 = [3 ** i for i in range(9)]
+NUM_STATES = 3 ** 9
+
+
+def pack_board(board):
+    state = 0
+    for i, cell in enumerate(board):
+        state += CELL_VALUE[cell] * POW3[i]
+    return state
+
+def unpack_masks(state):
+    # [empty, X, O] cell masks of a packed board.
+    masks = [0, 0, 0]
+    for i in range(9):
+        masks[state % 3] |= 1 << i
+        state //= 3
+    return masks
+
+# Each player's cells are also kept as a 9-bit mask (bit i = cell i), so a
+# win is a single AND-compare against each of the 8 line masks.
+LINES = [
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100
+]
+FULL_MASK = 0b111111111
+# The empty cells for every occupancy mask, so move generation is a lookup.
+VALID_ACTIONS = [
+    tuple(i for i in range(9) if not filled >> i & 1)
+    for filled in range(FULL_MASK + 1)
+]
+
+# The 8 rotations/reflections of the board: variant[i] = board[perm[i]].
+SYMMETRIES = [
+    [0, 1, 2, 3, 4, 5, 6, 7, 8], [6, 3, 0, 7, 4, 1, 8, 5, 2],
+    [8, 7, 6, 5, 4, 3, 2, 1, 0], [2, 5, 8, 1, 4, 7, 0, 3, 6],
+    [2, 1, 0, 5, 4, 3, 8, 7, 6], [6, 7, 8, 3, 4, 5, 0, 1, 2],
+    [0, 3, 6, 1, 4, 7, 2, 5, 8], [8, 5, 2, 7, 4, 1, 6, 3, 0]
+]
+# INVERSE_SYMMETRIES[k][cell] is where cell ends up in variant k.
+INVERSE_SYMMETRIES = [[perm.index(i) for i in range(9)] for perm in SYMMETRIES]
+
+
+def build_canonical_tables():
+    # For every packed board, the smallest packed value among its 8 variants
+    # and the index of the symmetry that produces it.
+    states = array("i", [0]) * NUM_STATES
+    symmetries = array("b", [0]) * NUM_STATES
+    for state in range(NUM_STATES):
+        digits = [state // p % 3 for p in POW3]
+        for k, perm in enumerate(SYMMETRIES):
+            variant = 0
+            for i in range(9):
+                variant += digits[perm[i]] * POW3[i]
+            if k == 0 or variant < states[state]:
+                states[state] = variant
+                symmetries[state] = k
+    return states, symmetries
+
+CANONICAL_STATE, CANONICAL_SYMMETRY = build_canonical_tables()
+
+
+def canonical(state, action):
+    return CANONICAL_STATE[state], INVERSE_SYMMETRIES[CANONICAL_SYMMETRY[state]][action]
+
+def new_q_table():
+    # One float32 per (state, action) pair: a flat, fixed-size table that is
+    # saved and loaded as raw bytes.
+    return array("f", [0.0]) * (NUM_STATES * 9)
+
+def q_key(state, action):
+    # Symmetric positions share one Q-table entry.
+    cs, ca = canonical(state, action)
+    return cs * 9 + ca
 
 # ---------------- Q-Learning Player ----------------
 class QLearningPlayer:
-    def __init__(self, symbol, q=None):
+    __slots__ = ("symbol", "opponent_symbol", "q", "policy")
+
+    def __init__(self, symbol, q=None, policy=None):
         self.symbol = symbol
         self.opponent_symbol = "O" if symbol == "X" else "X"
-        self.q = q if q is not None else {}
-
-    def get_state(self, board):
-        return "".join(board)
+        self.q = q if q is not None else new_q_table()
+        # A solved policy (see solve.py) to play instead of the Q-table.
+        self.policy = policy
 
-    def get_valid_actions(self, board):
-        return [i for i, cell in enumerate(board) if cell == "_"]
+    def get_valid_actions(self, filled):
+        return VALID_ACTIONS[filled]
 
-    def choose_action(self, board, explore=True):
-        state = self.get_state(board)
-        actions = self.get_valid_actions(board)
+    def choose_action(self, state, filled, explore=True):
+        actions = self.get_valid_actions(filled)
         if not actions:
             return None
 
-        if explore and random.random() < EPSILON:
-            return random.choice(actions)
-
-        q_values = [self.q.get(f"{state}:{a}", 0) for a in actions]
+        if self.policy is not None:
+            return self.policy[state]
+
+        if explore:
+            # A draw below EPSILON, rescaled by 1/EPSILON, is again uniform on
+            # [0, 1), so one call to the RNG both decides and picks the move.
+            u = random.random()
+            if u < EPSILON:
+                n = len(actions)
+                return actions[min(int(u / EPSILON * n), n - 1)]
+
+        # Same as q_key for each action, with the symmetry lookup hoisted.
+        base = CANONICAL_STATE[state] * 9
+        inverse = INVERSE_SYMMETRIES[CANONICAL_SYMMETRY[state]]
+        q = self.q
+        q_values = [q[base + inverse[a]] for a in actions]
         max_q = max(q_values)
-        best_actions = [a for a, q in zip(actions, q_values) if q == max_q]
+        if q_values.count(max_q) == 1:
+            return actions[q_values.index(max_q)]
+        best_actions = [a for a, v in zip(actions, q_values) if v == max_q]
         return random.choice(best_actions)
 
-    def update_q(self, old_state, action, reward, next_state, next_actions):
-        key = f"{old_state}:{action}"
-        old_q = self.q.get(key, 0)
-        next_q = max((self.q.get(f"{next_state}:{a}", 0) for a in next_actions), default=0)
-        new_q = old_q + ALPHA * (reward + GAMMA * next_q - old_q)
-        self.q[key] = new_q
+    def reward_terminal(self, keys, reward):
+        # Every reward comes at the end of the game, where there is no next
+        # state to bootstrap from, so each q_key the game visited takes the
+        # same step towards reward. A player following a solved policy
+        # doesn't learn, so it leaves the Q-table alone.
+        if self.policy is not None:
+            return
+        q = self.q
+        for key in keys:
+            q[key] += ALPHA * (reward - q[key])
 
 
 # ---------------- Helper Functions ----------------
-def check_win(board, symbol):
-    lines = [
-        [0,1,2],[3,4,5],[6,7,8],
-        [0,3,6],[1,4,7],[2,5,8],
-        [0,4,8],[2,4,6]
-    ]
-    return any(all(board[i] == symbol for i in line) for line in lines)
+def check_win(mask):
+    return any(mask & line == line for line in LINES)
+
+ONGOING, WIN, DRAW = 0, 1, 2
 
-def is_draw(board):
-    return "_" not in board
+def status(x_mask, o_mask, mover_mask):
+    # Result of the half-move that just produced mover_mask. Only the mover
+    # can have completed a line, and a full board without one is a draw.
+    if check_win(mover_mask):
+        return WIN
+    if x_mask | o_mask == FULL_MASK:
+        return DRAW
+    return ONGOING
 
 def load_json(path, default):
     if os.path.exists(path):
@@ -70,57 +173,258 @@ def load_json(path, default):
             print(f"⚠️  Failed to load {path}, resetting.")
     return default
 
-def save_json(path, data):
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
-
-
-# ---------------- Computer Opponent (Rule-Based) ----------------
-def computer_move(board, symbol, player_symbol):
-    empty = [i for i, cell in enumerate(board) if cell == "_"]
-    if not empty:
-        return None
-
-    for i in empty:
-        board[i] = symbol
-        if check_win(board, symbol):
-            board[i] = "_"
-            return i
-        board[i] = "_"
-
-    for i in empty:
-        board[i] = player_symbol
-        if check_win(board, player_symbol):
-            board[i] = "_"
-            return i
-        board[i] = "_"
-
-    for i in [0, 2, 6, 8]:
-        if board[i] == "_":
-            return i
-
-    if board[4] == "_":
-        return 4
+def load_q_table(path):
+    if os.path.exists(path):
+        try:
+            q = array("f")
+            with open(path, "rb") as f:
+                q.fromfile(f, NUM_STATES * 9)
+            return q
+        except Exception:
+            print(f"⚠️  Failed to load {path}, resetting.")
+        return new_q_table()
+
+    # Migrate a JSON table from an older version, keyed by "XO_...:action".
+    # Symmetric variants of a position fold into one entry, which gets the
+    # average of their values.
+    totals = {}
+    try:
+        for key, value in load_json(LEGACY_Q_FILE, {}).items():
+            board, action = key.split(":")
+            action = int(action)
+            if len(board) != 9 or any(c not in CELL_VALUE for c in board):
+                continue
+            if not 0 <= action < 9:
+                continue
+            index = q_key(pack_board(board), action)
+            total, count = totals.get(index, (0.0, 0))
+            totals[index] = (total + float(value), count + 1)
+    except Exception:
+        print(f"⚠️  Failed to load {LEGACY_Q_FILE}, resetting.")
+        return new_q_table()
+
+    q = new_q_table()
+    for index, (total, count) in totals.items():
+        q[index] = total / count
+    return q
+
+def save_q_table(path, q, sync=False):
+    # The table is fixed-size, so a save is one sequential write. Periodic
+    # saves leave flushing to the OS; pass sync=True to force it to disk.
+    with open(path, "wb") as f:
+        q.tofile(f)
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+
+def load_policy(path):
+    if os.path.exists(path):
+        try:
+            policy = array("b")
+            with open(path, "rb") as f:
+                policy.fromfile(f, NUM_STATES)
+            return policy
+        except Exception:
+            print(f"⚠️  Failed to load {path}, re-solving.")
+    policy = solve()[1]
+    save_policy(path, policy)
+    return policy
 
-    for i in [1, 3, 5, 7]:
-        if board[i] == "_":
-            return i
+def save_policy(path, policy):
+    with open(path, "wb") as f:
+        policy.tofile(f)
 
-    return random.choice(empty)
+def save_json(path, data, sync=False):
+    with open(path, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+# ---------------- Computer Opponent ----------------
+def build_win_table():
+    # WIN_TABLE[state * 3 + sym] is the lowest empty cell that completes a
+    # line for sym (1 = X, 2 = O) on the packed board, or -1 if none does.
+    table = array("b", [-1]) * (NUM_STATES * 3)
+    for state in range(NUM_STATES):
+        masks = unpack_masks(state)
+        empty = masks[0]
+        for sym in (1, 2):
+            for i in range(9):
+                if empty >> i & 1 and check_win(masks[sym] | 1 << i):
+                    table[state * 3 + sym] = i
+                    break
+    return table
+
+WIN_TABLE = build_win_table()
+
+# Exact values keyed by own_mask << 9 | opp_mask. Only full-window searches
+# are stored, since those results are never just bounds.
+_NEGAMAX_CACHE = {}
+
+def negamax(own_mask, opp_mask, alpha=-1, beta=1):
+    # Value (+1 win, 0 draw, -1 loss) of the position for the side to move,
+    # whose cells are own_mask; opp_mask has just moved.
+    key = own_mask << 9 | opp_mask
+    value = _NEGAMAX_CACHE.get(key)
+    if value is not None:
+        return value
+
+    if check_win(opp_mask):
+        value = -1
+    else:
+        empty = ~(own_mask | opp_mask) & FULL_MASK
+        if not empty:
+            value = 0
+        else:
+            value = -1
+            window = alpha
+            while empty:
+                bit = empty & -empty
+                empty ^= bit
+                child = -negamax(opp_mask, own_mask | bit, -beta, -window)
+                if child > value:
+                    value = child
+                    if value > window:
+                        window = value
+                    if window >= beta:
+                        break
+
+    if alpha == -1 and beta == 1:
+        _NEGAMAX_CACHE[key] = value
+    return value
+
+def computer_move(state, symbol):
+    return _computer_move_cached(state, CELL_VALUE[symbol])
+
+# The move is a pure function of the packed board, and there are only a few
+# thousand reachable boards, so every result is kept.
+@lru_cache(maxsize=32768)
+def _computer_move_cached(state, own):
+    win = WIN_TABLE[state * 3 + own]
+    if win >= 0:
+        return win
+
+    block = WIN_TABLE[state * 3 + 3 - own]
+    if block >= 0:
+        return block
+
+    # Otherwise search the rest of the game; the old corner/centre/side
+    # order now only breaks ties between equally good moves.
+    masks = unpack_masks(state)
+    own_mask, opp_mask = masks[own], masks[3 - own]
+    best, best_value = None, -2
+    for i in [0, 2, 6, 8, 4, 1, 3, 5, 7]:
+        if masks[0] >> i & 1:
+            value = -negamax(opp_mask, own_mask | 1 << i)
+            if value > best_value:
+                best, best_value = i, value
+    return best
+
+
+# ---------------- Retrograde Solver ----------------
+def solve():
+    # Works backwards from full boards, so every child of a position is
+    # valued before the position itself. values[state] is the game value
+    # (+1 win, 0 draw, -1 loss) for the side to move, and policy[state] the
+    # first cell that achieves it, or -1 if the game is over or the board
+    # can't occur (X always moves first).
+    values = array("b", [0]) * NUM_STATES
+    policy = array("b", [-1]) * NUM_STATES
+
+    boards = []
+    for state in range(NUM_STATES):
+        masks = unpack_masks(state)
+        x_count = bin(masks[1]).count("1")
+        o_count = bin(masks[2]).count("1")
+        if x_count == o_count or x_count == o_count + 1:
+            boards.append((x_count + o_count, state, masks))
+    boards.sort(reverse=True)
+
+    for filled, state, (empty, x_mask, o_mask) in boards:
+        if check_win(x_mask) or check_win(o_mask):
+            # The previous mover completed a line.
+            values[state] = -1
+            continue
+        if x_mask | o_mask == FULL_MASK:
+            continue
+
+        mover = 1 if filled % 2 == 0 else 2
+        best = -2
+        for i in range(9):
+            if empty >> i & 1:
+                value = -values[state + mover * POW3[i]]
+                if value > best:
+                    best = value
+                    policy[state] = i
+        values[state] = best
+
+    return values, policy
+
+
+# ---------------- Game Simulation ----------------
+def simulate_game(player):
+    # Plays one game of player (X) against computer_move (O) entirely on the
+    # packed state and bitmasks, updating player's Q-table at the end.
+    # Returns the outcome ("win", "draw" or "loss") and the moves played, in
+    # order, so the GUI can replay them if it wants to.
+    state = 0
+    x_mask = 0
+    o_mask = 0
+    history = []
+    moves = []
+
+    # Bound once, as this loop runs for every training game.
+    choose_action = player.choose_action
+    reward_terminal = player.reward_terminal
+    pow3 = POW3
+
+    while True:
+        action = choose_action(state, x_mask | o_mask, explore=True)
+        if action is None:
+            return "draw", moves
+
+        history.append(q_key(state, action))
+        moves.append(action)
+        state += pow3[action]
+        x_mask |= 1 << action
+
+        result = status(x_mask, o_mask, x_mask)
+        if result == WIN:
+            reward_terminal(history, 1)
+            return "win", moves
+        if result == DRAW:
+            reward_terminal(history, 0.2)
+            return "draw", moves
+
+        comp_action = computer_move(state, "O")
+        if comp_action is None:
+            return "draw", moves
+        moves.append(comp_action)
+        state += 2 * pow3[comp_action]
+        o_mask |= 1 << comp_action
+
+        result = status(x_mask, o_mask, o_mask)
+        if result == WIN:
+            reward_terminal(history[-1:], -1)
+            return "loss", moves
+        if result == DRAW:
+            reward_terminal(history, 0.2)
+            return "draw", moves
 
 
 # ---------------- Trainer ----------------
 class Trainer:
+    __slots__ = ("gui", "q_table", "stats", "policy", "running", "next_move_time")
+
     def __init__(self, gui):
         self.gui = gui
-        self.q_table = load_json(Q_FILE, {})
+        self.q_table = load_q_table(Q_FILE)
         self.stats = load_json(STATS_FILE, {"games": 0, "wins": 0, "draws": 0})
+        self.policy = load_policy(POLICY_FILE)
         self.running = False
-
-    def reset_board(self):
-        self.board = ["_"] * 9
-        for b in self.gui.buttons:
-            b.config(text="", bg="SystemButtonFace")
+        self.next_move_time = time.monotonic()
 
     def update_gui_stats(self):
         s = self.stats
@@ -128,84 +432,91 @@ class Trainer:
             text=f"Games: {s['games']} | Wins: {s['wins']} | Draws: {s['draws']} | Epsilon: {EPSILON:.3f}"
         )
 
-    def play_one_game(self):
+    def show_game(self, moves):
+        if not self.gui.render_moves_var.get():
+            board = [""] * 9
+            for n, action in enumerate(moves):
+                board[action] = "X" if n % 2 == 0 else "O"
+            self.gui.render_board(board)
+            # One paced step per rendered game, so the speed slider still
+            # applies when moves aren't animated.
+            self.wait_for_next_move()
+            return
+
+        self.gui.clear_board()
+        for n, action in enumerate(moves):
+            self.gui.update_button(action, "X" if n % 2 == 0 else "O")
+            # Only flush redraws here; input events (e.g. Stop) are handled by
+            # the mainloop between batches.
+            self.gui.root.update_idletasks()
+            self.wait_for_next_move()
+
+    def wait_for_next_move(self):
+        # Sleep against an accumulated deadline rather than a fixed interval,
+        # and only when far enough ahead that the OS can honour it. Time lost
+        # while behind schedule isn't banked, so a slow frame doesn't turn the
+        # next game into a burst of instant moves.
+        now = time.monotonic()
+        delay = self.next_move_time - now
+        if delay > MIN_SLEEP:
+            time.sleep(delay)
+        elif delay < 0:
+            self.next_move_time = now
+        self.next_move_time += 1.0 / self.gui.speed_var.get()
+
+    def play_one_game_headless(self):
         global EPSILON
-        player = QLearningPlayer("X", self.q_table)
-        self.reset_board()
-        history = []
-
-        while True:
-            state = player.get_state(self.board)
-            action = player.choose_action(self.board, explore=True)
-            if action is None:
-                break
-
-            self.board[action] = player.symbol
-            self.gui.update_button(action, player.symbol)
-            history.append((state, action))
-            self.gui.root.update()
-
-            time.sleep(1.0 / self.gui.speed_var.get())
-
-            if check_win(self.board, player.symbol):
-                for s, a in reversed(history):
-                    player.update_q(s, a, 1, player.get_state(self.board), [])
-                self.stats["wins"] += 1
-                self.stats["games"] += 1
-                break
-
-            if is_draw(self.board):
-                for s, a in history:
-                    player.update_q(s, a, 0.2, player.get_state(self.board), [])
-                self.stats["draws"] += 1
-                self.stats["games"] += 1
-                break
-                
-            comp_action = computer_move(self.board, "O", player.symbol)
-            if comp_action is None:
-                break
-            self.board[comp_action] = "O"
-            self.gui.update_button(comp_action, "O")
-            self.gui.root.update()
-
-            time.sleep(1.0 / self.gui.speed_var.get())
-
-            if check_win(self.board, "O"):
-                last_state, last_action = history[-1]
-                player.update_q(last_state, last_action, -1, player.get_state(self.board), [])
-                self.stats["games"] += 1
-                break
-
-            if is_draw(self.board):
-                for s, a in history:
-                    player.update_q(s, a, 0.2, player.get_state(self.board), [])
-                self.stats["draws"] += 1
-                self.stats["games"] += 1
-                break
+        policy = self.policy if self.gui.optimal_var.get() else None
+        player = QLearningPlayer("X", self.q_table, policy)
+        outcome, moves = simulate_game(player)
+        # Games played by the solved policy are for show: they don't count
+        # towards the training stats or decay exploration.
+        if policy is not None:
+            return moves
+
+        stats = self.stats
+        stats["games"] += 1
+        if outcome == "win":
+            stats["wins"] += 1
+        elif outcome == "draw":
+            stats["draws"] += 1
 
         EPSILON = max(MIN_EPSILON, EPSILON * EPSILON_DECAY)
-        if self.stats["games"] % SAVE_INTERVAL == 0:
-            save_json(Q_FILE, self.q_table)
-            save_json(STATS_FILE, self.stats)
-        self.update_gui_stats()
+        if stats["games"] & (SAVE_INTERVAL - 1) == 0:
+            save_q_table(Q_FILE, self.q_table)
+            save_json(STATS_FILE, stats)
+        return moves
+
+    def play_one_game(self):
+        moves = self.play_one_game_headless()
+        if self.gui.display_var.get():
+            self.show_game(moves)
+        self.gui.root.after_idle(self.update_gui_stats)
 
     def loop(self):
         if not self.running:
             return
+        # Play a batch of games per frame so throughput isn't capped by Tk
+        # event handling; only the last game of each batch is displayed.
+        batch_size = max(1, int(self.gui.speed_var.get() // 10))
+        for _ in range(batch_size - 1):
+            self.play_one_game_headless()
         self.play_one_game()
-        self.gui.root.after(10, self.loop)
+        self.gui.root.update_idletasks()
+        self.gui.root.after(1, self.loop)
 
     def start_training(self):
         if self.running:
             return
         self.running = True
+        self.next_move_time = time.monotonic()
         self.gui.status_label.config(text="Training vs Computer...")
         self.loop()
 
     def stop_training(self):
         self.running = False
-        save_json(Q_FILE, self.q_table)
-        save_json(STATS_FILE, self.stats)
+        save_q_table(Q_FILE, self.q_table, sync=True)
+        save_json(STATS_FILE, self.stats, sync=True)
         self.gui.status_label.config(text="Paused. Q-table and stats saved.")
 
 
@@ -214,13 +525,15 @@ class TicTacToeGUI:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Tic Tac Toe Q-Learning vs Computer")
-        self.root.geometry("420x620")
+        self.root.geometry("420x740")
 
         self.buttons = []
         for i in range(9):
             b = tk.Button(self.root, text="", width=8, height=4, font=("Arial", 20))
             b.grid(row=i//3, column=i%3, padx=5, pady=5)
             self.buttons.append(b)
+        # (text, fg) last sent to each button, to skip no-op Tk configs.
+        self._last = [("", "")] * 9
 
         self.stats_label = tk.Label(self.root, text="", font=("Arial", 14))
         self.stats_label.grid(row=3, column=0, columnspan=3, pady=10)
@@ -236,19 +549,61 @@ class TicTacToeGUI:
         )
         self.speed_slider.grid(row=6, column=0, columnspan=3, pady=5)
 
+        self.display_var = tk.BooleanVar(value=True)
+        self.display_check = tk.Checkbutton(
+            self.root, text="Display games", variable=self.display_var
+        )
+        self.display_check.grid(row=7, column=0, columnspan=3)
+
+        self.render_moves_var = tk.BooleanVar(value=True)
+        self.render_moves_check = tk.Checkbutton(
+            self.root, text="Animate moves", variable=self.render_moves_var
+        )
+        self.render_moves_check.grid(row=8, column=0, columnspan=3)
+
+        self.optimal_var = tk.BooleanVar(value=False)
+        self.optimal_check = tk.Checkbutton(
+            self.root, text="Play solved policy", variable=self.optimal_var
+        )
+        self.optimal_check.grid(row=9, column=0, columnspan=3)
+
         self.start_btn = tk.Button(self.root, text="▶ Start", command=self.start_training)
-        self.start_btn.grid(row=7, column=0, columnspan=3, pady=5)
+        self.start_btn.grid(row=10, column=0, columnspan=3, pady=5)
 
         self.stop_btn = tk.Button(self.root, text="⏸ Stop", command=self.stop_training)
-        self.stop_btn.grid(row=8, column=0, columnspan=3, pady=5)
+        self.stop_btn.grid(row=11, column=0, columnspan=3, pady=5)
 
         self.trainer = Trainer(self)
         self.trainer.update_gui_stats()
 
     def update_button(self, index, symbol):
+        # An empty symbol means a cleared cell, cached as ("", "") to match
+        # clear_board.
+        if not symbol:
+            if self._last[index] == ("", ""):
+                return
+            self._last[index] = ("", "")
+            self.buttons[index].config(text="")
+            return
+
         color = "blue" if symbol == "X" else "red"
+        if self._last[index] == (symbol, color):
+            return
+        self._last[index] = (symbol, color)
         self.buttons[index].config(text=symbol, fg=color)
 
+    def clear_board(self):
+        for b in self.buttons:
+            b.config(text="", bg="SystemButtonFace")
+        self._last = [("", "")] * 9
+
+    def render_board(self, board):
+        # Draw a whole board at once; cells unchanged since the last draw
+        # are skipped by update_button.
+        for i, symbol in enumerate(board):
+            self.update_button(i, symbol)
+        self.root.update_idletasks()
+
     def start_training(self):
         self.trainer.start_training()
 